@@ -35,7 +35,12 @@ setup(
     url="https://launchpad.net/auto-upgrade-testing",
     license="GPLv3",
     packages=find_packages(),
-    package_data={"upgrade_testing": ["data/*"]},
+    package_data={
+        "upgrade_testing": [
+            "data/debian_template/*",
+            "data/debian_template/tests/*",
+        ]
+    },
     entry_points={
         "console_scripts": [
             "auto-upgrade-testing = upgrade_testing.command_line:main"
@@ -18,6 +18,7 @@
 
 import logging
 import os
+import re
 from collections import namedtuple
 
 import yaml
@@ -27,6 +28,10 @@ from upgrade_testing.provisioning import ProvisionSpecification
 logger = logging.getLogger(__name__)
 
 
+# Characters that break a script name once it is in the run config (see
+# _check_script_names).
+_UNSUPPORTED_SCRIPT_NAME_CHARS = re.compile(r'[\s*?\["$`\\]')
+
 ScriptStore = namedtuple("ScriptStore", ["executables", "location"])
 
 
@@ -134,6 +139,7 @@ def _get_list_of_scripts_locations(scripts, script_source_path):
 
     :raises ValueError: If `script_source_path` is None.
     :raises ValueError: If a declared script is not found on the filesystem.
+    :raises ValueError: If a script name can't be used in the run config.
 
     :returns: tuple containing a list of script names and a string containing
       the location path.
@@ -150,6 +156,7 @@ def _get_list_of_scripts_locations(scripts, script_source_path):
                     f, sane_script_location
                 )
             )
+    _check_script_names(scripts)
     return (scripts, script_source_path)
 
 
@@ -170,6 +177,7 @@ def _get_list_of_scripts_in_directory(abs_path):
 
     :raises ValueError: If no executable scripts can be found at the supplied
       location.
+    :raises ValueError: If a script name can't be used in the run config.
 
     """
     script_file_list = _get_executable_files(abs_path)
@@ -177,10 +185,29 @@ def _get_list_of_scripts_in_directory(abs_path):
         raise ValueError(
             "No executatble scripts found at location: {}".format(abs_path)
         )
+    _check_script_names(script_file_list)
     # Update the script_location path to suit.
     return (script_file_list, "file://{}".format(abs_path))
 
 
+def _check_script_names(scripts):
+    """Ensure the script names can be passed through the run config.
+
+    The names are written space separated into a double quoted value that the
+    upgrade script sources and then word-splits (and globs) without any
+    unquoting, so whitespace, glob characters and characters special within
+    double quotes can't be used.
+
+    :raises ValueError: If a script name contains one of those characters.
+
+    """
+    for name in scripts:
+        if _UNSUPPORTED_SCRIPT_NAME_CHARS.search(name):
+            raise ValueError(
+                "Unsupported characters in script name: {!r}".format(name)
+            )
+
+
 def _get_executable_files(abs_path):
     def is_executable(path):
         return os.path.isfile(path) and os.access(path, os.X_OK)
@@ -16,10 +16,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-import pkg_resources
+import os
 
+import upgrade_testing
+
+_DATA_LOCATION = os.path.join(
+    os.path.dirname(upgrade_testing.__file__), "data"
+)
 
-def get_file_data_location():
-    import upgrade_testing
 
-    return pkg_resources.resource_filename(upgrade_testing.__name__, "data")
+def get_file_data_location():
+    return _DATA_LOCATION
@@ -19,7 +19,10 @@
 import json
 import logging
 import os
+import pathlib
 import shutil
+import stat
+import sys
 import tempfile
 from collections import namedtuple
 from contextlib import contextmanager
@@ -35,6 +38,27 @@ from upgrade_testing.provisioning import run_command_with_logged_output
 
 DEFAULT_GIT_URL = "git://anonscm.debian.org/autopkgtest/autopkgtest.git"
 
+# Buffer size used when copying data files on pythons older than 3.8, where
+# shutil.copyfile has no fast-copy and its buffer is only 16KiB.
+_COPY_BUFSIZE = 256 * 1024
+
+# Template for the per-run config that is sourced by the upgrade script.
+# Need to store the expected pristine system and the post-upgrade system
+# Note: This will only support one upgrade, for first -> final
+_RUN_CONFIG_TEMPLATE = dedent(
+    """\
+    # Auto Upgrade Test Configuration
+    PRE_TEST_LOCATION="{testbed_location}/scripts"
+    POST_TEST_LOCATION="{testbed_location}/scripts"
+    PRE_TESTS_TO_RUN="{pre_tests}"
+    POST_TESTS_TO_RUN="{post_tests}"
+    INITIAL_SYSTEM_STATE="{initial_state}"
+    POST_SYSTEM_STATE="{final_state}"
+    RUNNING_BACKEND={backend_name}
+    DO_RELEASE_UPGRADE_PROMPT={do_release_upgrade_prompt}
+    """
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,11 +91,10 @@ def prepare_test_environment(testsuite):
 
     """
 
-    try:
-        temp_dir = tempfile.mkdtemp()
+    with tempfile.TemporaryDirectory() as temp_dir:
         run_config_path = _write_run_config(testsuite, temp_dir)
         unbuilt_dir = _create_autopkg_details(temp_dir)
-        logger.info("Unbuilt dir: {}".format(unbuilt_dir))
+        logger.info("Unbuilt dir: %s", unbuilt_dir)
 
         scripts_path = os.path.join(temp_dir, "scripts")
         _copy_script_files(testsuite.scripts_location, scripts_path)
@@ -92,18 +115,12 @@ def prepare_test_environment(testsuite):
             testrun_tmp_dir=temp_dir,
             scripts=scripts_path,
         )
-    finally:
-        _cleanup_dir(temp_dir)
 
 
 def _copy_script_files(script_location, script_destination):
     return test_source_retriever(script_location, script_destination)
 
 
-def _cleanup_dir(dir):
-    shutil.rmtree(dir)
-
-
 def _write_run_config(testsuite, temp_dir):
     """Write a config file for this run of testing.
 
@@ -111,43 +128,22 @@ def _write_run_config(testsuite, temp_dir):
     as the dynamic details produced each run (temp dir etc.).
 
     """
-    run_config_file = tempfile.mkstemp(dir=temp_dir)[1]
-    with open(run_config_file, "w") as f:
-        config_string = dedent(
-            """\
-            # Auto Upgrade Test Configuration
-            PRE_TEST_LOCATION="{testbed_location}/scripts"
-            POST_TEST_LOCATION="{testbed_location}/scripts"
-        """.format(
-                testbed_location=get_testbed_storage_location()
-            )
-        )
-        f.write(config_string)
-        pre_tests = " ".join(testsuite.pre_upgrade_scripts.executables)
-        post_tests = " ".join(testsuite.post_upgrade_tests.executables)
-        f.write('PRE_TESTS_TO_RUN="{}"\n'.format(pre_tests))
-        f.write('POST_TESTS_TO_RUN="{}"\n'.format(post_tests))
-        # Need to store the expected pristine system and the post-upgrade
-        # system
-        # Note: This will only support one upgrade, for first -> final
-        f.write(
-            'INITIAL_SYSTEM_STATE="{}"\n'.format(
-                testsuite.provisioning.initial_state
-            )
-        )
-        f.write(
-            'POST_SYSTEM_STATE="{}"\n'.format(
-                testsuite.provisioning.final_state
-            )
-        )
-        f.write(
-            "RUNNING_BACKEND={}\n".format(testsuite.provisioning.backend_name)
-        )
-        f.write(
-            "DO_RELEASE_UPGRADE_PROMPT={}\n".format(
-                testsuite.provisioning.do_release_upgrade_prompt
-            )
-        )
+    testbed_location = get_testbed_storage_location()
+    pre_tests = " ".join(testsuite.pre_upgrade_scripts.executables)
+    post_tests = " ".join(testsuite.post_upgrade_tests.executables)
+    provisioning = testsuite.provisioning
+    config_string = _RUN_CONFIG_TEMPLATE.format(
+        testbed_location=testbed_location,
+        pre_tests=pre_tests,
+        post_tests=post_tests,
+        initial_state=provisioning.initial_state,
+        final_state=provisioning.final_state,
+        backend_name=provisioning.backend_name,
+        do_release_upgrade_prompt=provisioning.do_release_upgrade_prompt,
+    )
+    fd, run_config_file = tempfile.mkstemp(dir=temp_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(config_string.encode("utf-8"))
     return run_config_file
 
 
@@ -158,32 +154,44 @@ def _create_autopkg_details(temp_dir):
     needed files.
 
     The test file that is executed is already populated and part of this
-    project.
+    project (see data/debian_template).
 
     """
     dir_tree = os.path.join(temp_dir, "debian")
-    test_dir_tree = os.path.join(dir_tree, "tests")
-    os.makedirs(test_dir_tree)
-
-    source_dir = get_file_data_location()
-
-    def _copy_file(dest, name):
-        """Copy a file from the source data dir to dest."""
-        src = os.path.join(source_dir, name)
-        dst = os.path.join(dest, name)
-        shutil.copyfile(src, dst)
-
-    _copy_file(test_dir_tree, "control")
-    _copy_file(test_dir_tree, "upgrade")
-    _copy_file(dir_tree, "changelog")
+    template_dir = os.path.join(get_file_data_location(), "debian_template")
+    shutil.copytree(template_dir, dir_tree, copy_function=_link_or_copy)
 
     # Main control file can be empty
     dummy_control = os.path.join(dir_tree, "control")
-    open(dummy_control, "a").close()
+    try:
+        os.mknod(dummy_control, stat.S_IFREG | 0o644)
+    except (AttributeError, OSError):
+        # No mknod (or not permitted to use it for regular files) on this
+        # platform.
+        pathlib.Path(dummy_control).touch()
 
     return dir_tree
 
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy if that isn't possible.
+
+    The template files are static and the temp dir is thrown away once the run
+    is done so a link is enough, copying is only needed when the temp dir is on
+    a different filesystem (or linking is otherwise unsupported).
+
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        if sys.version_info >= (3, 8):
+            # Uses the platform fast-copy (i.e. sendfile) where available.
+            shutil.copyfile(src, dst)
+        else:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
+
 def _get_adt_path(tmp_dir):
     # Check if we need to get a git version of autopkgtest
     # (If environment variables are set or a local version can't be found)
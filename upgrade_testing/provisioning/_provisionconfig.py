@@ -19,30 +19,33 @@
 import logging
 import os
 import re
+from abc import ABCMeta, abstractmethod
 
 from upgrade_testing.provisioning import backends
 
 logger = logging.getLogger(__name__)
 
 
-class ProvisionSpecification:
-    def __init__(self):
-        raise NotImplementedError()
+class ProvisionSpecification(metaclass=ABCMeta):
+    __slots__ = ("releases", "_initial_state", "_final_state")
 
     @property
+    @abstractmethod
     def system_states(self):
         # Note: Rename from releases
-        raise NotImplementedError()
+        pass
 
     @property
+    @abstractmethod
     def initial_state(self):
         """Return the string indicating the required initial system state."""
-        raise NotImplementedError()
+        pass
 
     @property
+    @abstractmethod
     def final_state(self):
         """Return the string indicating the required final system state."""
-        raise NotImplementedError()
+        pass
 
     @property
     def backend_name(self):
@@ -60,9 +63,24 @@ class ProvisionSpecification:
     def close(self):
         return self.backend.close() if hasattr(self.backend, "close") else None
 
+    @abstractmethod
     def get_adt_run_args(self, **kwargs):
         """Return list with the adt args for this provisioning backend."""
-        raise NotImplementedError()
+        pass
+
+    def _store_releases(self, provision_config):
+        """Store the releases from provision_config and the states they imply.
+
+        :raises ValueError: if the config doesn't list any releases.
+
+        """
+        releases = list(provision_config["releases"])
+        if not releases:
+            raise ValueError("releases must contain at least one release.")
+        self.releases = releases
+        # The states are fixed for the lifetime of the spec.
+        self._initial_state = releases[0]
+        self._final_state = releases[-1]
 
     @staticmethod
     def from_testspec(spec, spec_path):
@@ -80,22 +98,26 @@ class ProvisionSpecification:
 
 
 def get_specification_type(spec_name):
-    __spec_map = dict(
-        lxc=LXCProvisionSpecification,
-        qemu=QemuProvisionSpecification,
-    )
     try:
-        return __spec_map[spec_name]
+        return _SPEC_MAP[spec_name]
     except KeyError:
         logger.error("Unknown spec name: {}".format(spec_name))
         raise
 
 
 class LXCProvisionSpecification(ProvisionSpecification):
+    __slots__ = (
+        "distribution",
+        "arch",
+        "do_release_upgrade_prompt",
+        "_provisionconfig_path",
+        "backend",
+    )
+
     def __init__(self, provision_config, provision_path):
         # Defaults to ubuntu
         self.distribution = provision_config.get("distribution", "ubuntu")
-        self.releases = provision_config["releases"]
+        self._store_releases(provision_config)
         self.arch = provision_config["arch"]
         self.do_release_upgrade_prompt = provision_config.get(
             "do_release_upgrade_prompt", ""
@@ -103,7 +125,7 @@ class LXCProvisionSpecification(ProvisionSpecification):
         self._provisionconfig_path = provision_path
 
         self.backend = backends.LXCBackend(
-            self.initial_state, self.distribution, self.arch
+            self._initial_state, self.distribution, self.arch
         )
 
     @property
@@ -114,12 +136,12 @@ class LXCProvisionSpecification(ProvisionSpecification):
     @property
     def initial_state(self):
         """Return the string indicating the required initial system state."""
-        return self.releases[0]
+        return self._initial_state
 
     @property
     def final_state(self):
         """Return the string indicating the required final system state."""
-        return self.releases[-1]
+        return self._final_state
 
     def get_adt_run_args(self, **kwargs):
         """Return list with the adt args for this provisioning backend."""
@@ -135,10 +157,19 @@ class LXCProvisionSpecification(ProvisionSpecification):
 
 
 class QemuProvisionSpecification(ProvisionSpecification):
+    __slots__ = (
+        "_provisionconfig_path",
+        "arch",
+        "do_release_upgrade_prompt",
+        "image_name",
+        "build_args",
+        "backend",
+    )
+
     def __init__(self, provision_config, provision_path):
         self._provisionconfig_path = provision_path
 
-        self.releases = provision_config["releases"]
+        self._store_releases(provision_config)
         self.arch = provision_config.get("arch", "amd64")
         self.do_release_upgrade_prompt = provision_config.get(
             "do_release_upgrade_prompt", ""
@@ -146,7 +177,7 @@ class QemuProvisionSpecification(ProvisionSpecification):
         self.image_name = provision_config.get(
             "image_name",
             "autopkgtest-{}-{}-cloud.img".format(
-                self.initial_state, self.arch
+                self._initial_state, self.arch
             ),
         )
         provision_config_directory = os.path.dirname(
@@ -158,7 +189,7 @@ class QemuProvisionSpecification(ProvisionSpecification):
         logger.info("Using build args: {}".format(self.build_args))
 
         self.backend = backends.QemuBackend(
-            self.initial_state,
+            self._initial_state,
             self.arch,
             self.image_name,
             self.build_args,
@@ -172,12 +203,12 @@ class QemuProvisionSpecification(ProvisionSpecification):
     @property
     def initial_state(self):
         """Return the string indicating the required initial system state."""
-        return self.releases[0]
+        return self._initial_state
 
     @property
     def final_state(self):
         """Return the string indicating the required final system state."""
-        return self.releases[-1]
+        return self._final_state
 
     def get_adt_run_args(self, **kwargs):
         """Return list with the adt args for this provisioning backend."""
@@ -192,6 +223,13 @@ class QemuProvisionSpecification(ProvisionSpecification):
         )
 
 
+# Maps the backend name used in a spec to its specification type.
+_SPEC_MAP = dict(
+    lxc=LXCProvisionSpecification,
+    qemu=QemuProvisionSpecification,
+)
+
+
 def _render_build_args(build_args, profile_path):
     """Modify build args if required, returns a build args list.append
 
@@ -16,6 +16,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import os
+import tempfile
 import unittest
 
 from upgrade_testing.configspec import _config as _c
@@ -27,3 +29,36 @@ class HelperMethodTestCases(unittest.TestCase):
 
     def test_read_yaml_config_raises_on_nonexistant_file(self):
         self.assertRaises(FileNotFoundError, _c._read_yaml_config, "test.txt")
+
+
+class CheckScriptNamesTestCases(unittest.TestCase):
+    def test_accepts_names_that_survive_the_run_config(self):
+        names = ["check.sh~", "a~b", "x(1)", "it's", "a&b", "a;b", "a#b", "a!"]
+        _c._check_script_names(names)
+
+    def test_raises_ValueError_on_unsupported_characters(self):
+        for name in ["a b", "a\tb", "a*", "a?", "a[1]", 'a"b', "$a", "a`b"]:
+            with self.subTest(name=name):
+                self.assertRaises(ValueError, _c._check_script_names, [name])
+
+    def test_raises_ValueError_on_backslash(self):
+        self.assertRaises(ValueError, _c._check_script_names, ["a\\b"])
+
+    def test_scripts_in_directory_raises_ValueError_on_unsupported_name(self):
+        with tempfile.TemporaryDirectory() as script_dir:
+            script_path = os.path.join(script_dir, "foo bar.sh")
+            open(script_path, "w").close()
+            os.chmod(script_path, 0o755)
+            self.assertRaises(
+                ValueError, _c._get_list_of_scripts_in_directory, script_dir
+            )
+
+    def test_scripts_locations_raises_ValueError_on_unsupported_name(self):
+        with tempfile.TemporaryDirectory() as script_dir:
+            open(os.path.join(script_dir, "foo bar.sh"), "w").close()
+            self.assertRaises(
+                ValueError,
+                _c._get_list_of_scripts_locations,
+                ["foo bar.sh"],
+                "file://{}".format(script_dir),
+            )
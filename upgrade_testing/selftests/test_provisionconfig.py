@@ -128,6 +128,14 @@ class RenderBuildArgsTestCase(unittest.TestCase):
         )
 
 
+class LXCProvisionSpecificationTestCases(unittest.TestCase):
+    def test_raises_ValueError_if_no_releases(self):
+        spec = dict(releases=[], arch="test arch")
+        self.assertRaises(
+            ValueError, _p.LXCProvisionSpecification, spec, "/test.yaml"
+        )
+
+
 class QemuProvisionSpecificationTestCases(unittest.TestCase):
     def test_stores_passed_specification_details(self):
         """QemuProvisionSpecification must store the passed details regarding
@@ -149,3 +157,20 @@ class QemuProvisionSpecificationTestCases(unittest.TestCase):
         self.assertEqual(qemu_spec.image_name, spec["image_name"])
         self.assertEqual(qemu_spec.build_args, ["/test/path"])
         self.assertEqual(qemu_spec.initial_state, "release 1")
+        self.assertEqual(qemu_spec.final_state, "release 2")
+
+    def test_stores_releases_as_a_list(self):
+        spec = dict(releases=("release 1", "release 2"))
+        qemu_spec = _p.QemuProvisionSpecification(spec, "/test.yaml")
+        self.assertEqual(qemu_spec.releases, ["release 1", "release 2"])
+
+    def test_raises_ValueError_if_no_releases(self):
+        spec = dict(releases=[])
+        self.assertRaises(
+            ValueError, _p.QemuProvisionSpecification, spec, "/test.yaml"
+        )
+
+
+class ProvisionSpecificationTestCases(unittest.TestCase):
+    def test_base_specification_cannot_be_instantiated(self):
+        self.assertRaises(TypeError, _p.ProvisionSpecification)